@@ -1,29 +1,26 @@
 from PySide6.QtCore import  QObject,  Slot
 import onnxruntime as rt
-import json
 from PIL import Image
 from .simple_tokenizer import SimpleTokenizer as Tokenizer
 from .ops import non_max_suppression, xyxy2xywh
 import numpy as np
 from .base_info import version
+from .base import get_providers
+from .file_io import save_json
 class AutoLabel(QObject):
     def __init__(self) -> None:
         super().__init__()
         self.engine = None
+        self.tokenizer = None
         
     @Slot()
     def create(self):
-        self.yolo = rt.InferenceSession("_internal/resource/yolov8x-worldv2.onnx", providers=['CPUExecutionProvider'])
+        providers = get_providers()
+        self.yolo = rt.InferenceSession("_internal/resource/yolov8x-worldv2.onnx", providers=providers)
         # Load a pretrained YOLOv8s-worldv2 model
-        self.clip = rt.InferenceSession("_internal/resource/clip.onnx", providers=['CPUExecutionProvider'])
+        self.clip = rt.InferenceSession("_internal/resource/clip.onnx", providers=providers)
         
 
-    @Slot(list)    
-    def set_classes(self, props):
-        print(props)
-        self.classes = props
-        self.get_token()
-        
     @Slot(str)    
     def set_classes(self, props):
         props = props.split(",")
@@ -43,7 +40,9 @@ class AutoLabel(QObject):
         
     def tokenize(self, texts, context_length: int = 77, truncate: bool = False):
 
-        _tokenizer = Tokenizer()
+        if self.tokenizer is None:
+            self.tokenizer = Tokenizer()
+        _tokenizer = self.tokenizer
         
         if isinstance(texts, str):
             texts = [texts]
@@ -97,27 +96,24 @@ class AutoLabel(QObject):
         self.serialize(preds, output_path)
             
     def serialize(self, dets, output_path):
-        res = {}
-        res["version"] = version
         shapes_res = []
+        classes = self.classes
         for i, det in enumerate(dets):
-            for j, r in enumerate(det):
-                
-                xyxy = r[0:4]
-                xywh = xyxy2xywh(xyxy)
-                det_res = {}
-                det_res["type"] = "rect"
-                det_res["x"] = float(xyxy[0])
-                det_res["y"] = float(xyxy[1])
-                det_res["width"] = float(xywh[2])
-                det_res["height"] = float(xywh[3])
-                det_res["rotation"] = 0.0
-                det_res["objType"] = self.classes[int(r[5])]
-                shapes_res.append(det_res)
+            # 整批转换后一次性转成 python 数值, 避免逐框分配数组
+            xyxys = det[:, 0:4].tolist()
+            xywhs = xyxy2xywh(det[:, 0:4]).tolist()
+            clss = det[:, 5].astype(np.int64).tolist()
+            shapes_res.extend({
+                "type": "rect",
+                "x": xyxy[0],
+                "y": xyxy[1],
+                "width": xywh[2],
+                "height": xywh[3],
+                "rotation": 0.0,
+                "objType": classes[c],
+            } for xyxy, xywh, c in zip(xyxys, xywhs, clss))
        
-        res["shapes"] = shapes_res
-        json_dict = json.dumps(res)
-        with open(output_path.replace("file:///", ""), "w", encoding='utf-8') as f:
-            f.write(json_dict)
+        res = {"version": version, "shapes": shapes_res}
+        save_json(output_path.replace("file:///", ""), res)
     
     
\ No newline at end of file
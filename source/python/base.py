@@ -1,3 +1,6 @@
+import onnxruntime as rt
+
+
 class ClassRegistry:
     def __init__(self):
         self.classes = {}
@@ -13,4 +16,30 @@ class ClassRegistry:
 
 
 # 创建一个类注册器实例
-registry = ClassRegistry()
\ No newline at end of file
+registry = ClassRegistry()
+
+# 推理后端优先级, 当前环境不可用的会被跳过, CPU 兜底
+# 不默认启用 TensorRT: 模型输入尺寸随图片和类别数变化, 未配置引擎缓存时每次启动/每个新尺寸都要重新构建引擎
+PREFERRED_PROVIDERS = [
+    "CUDAExecutionProvider",
+    "DmlExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "CoreMLExecutionProvider",
+    "CPUExecutionProvider",
+]
+GPU_PROVIDERS = ("CUDAExecutionProvider", "DmlExecutionProvider")
+
+
+def get_providers(device_id=0):
+    avail = set(rt.get_available_providers())
+    providers = []
+    for p in PREFERRED_PROVIDERS:
+        if p not in avail:
+            continue
+        if p in GPU_PROVIDERS:
+            providers.append((p, {"device_id": device_id}))
+        else:
+            providers.append(p)
+    if not providers:
+        providers.append("CPUExecutionProvider")
+    return providers
@@ -1,15 +1,20 @@
 import file_io
 import os
+from concurrent.futures import ThreadPoolExecutor
 if __name__ == "__main__":
-    file = file_io.File()
     folder = os.path.exists("resource")
-    if not folder:                  
+    if not folder:
         os.makedirs("resource")
-    for parent, dirnames, filenames in os.walk("resource"): 
+    # 输出统一放在 resource 下, 不同子目录中的同名文件会写到同一目标
+    # 按目标去重, 与逐个处理时一样保留最后一个, 避免并行写同一个文件
+    jobs = {}
+    for parent, dirnames, filenames in os.walk("resource"):
         for filename in filenames:
             if ".json" in filename:
-                ctx = file.readFile(os.path.join(parent, filename), "rb", "")
-                file.saveFile(os.path.join("resource", filename), ctx, "wb", "base64")
+                jobs[os.path.join("resource", filename)] = os.path.join(parent, filename)
             if ".onnx" in filename:
-                ctx = file.readFile(os.path.join(parent, filename), "rb", "")
-                file.saveFile(os.path.join("resource", filename.replace(".onnx", ".bin")), ctx, "wb", "base64")
\ No newline at end of file
+                jobs[os.path.join("resource", filename.replace(".onnx", ".bin"))] = os.path.join(parent, filename)
+    # 各文件之间相互独立, 文件读写会释放 GIL, 并行处理
+    # (pybase64 编码也会释放 GIL, 回退到标准库 base64 时编码部分仍是串行的)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(lambda job: file_io.encrypt_file(job[1], job[0]), jobs.items()))
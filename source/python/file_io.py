@@ -1,6 +1,37 @@
 from PySide6.QtCore import QObject,  Slot
 import os 
-import base64
+import json
+import hashlib
+from contextlib import contextmanager
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 切图时自动保存的临时标注文件后缀, 丢失可以接受, 写入时不做 fsync
+TEMP_SUFFIX = ".maple"
+
+
+@contextmanager
+def atomic_write(path, mode="wb", durable=False, **kwargs):
+    # 先写同目录下的临时文件再替换, 中途崩溃不会留下写了一半的文件
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 def encrypt(data):
@@ -11,24 +42,76 @@ def decrypt(encrypted_data):
     return base64.b64decode(encrypted_data)
 
 
+def encrypt_file(src_path, dst_path, chunk_size=3 * 65536):
+    # 按 3 字节对齐分块编码, 拼接结果与整体编码一致, 内存占用与文件大小无关
+    # 源文件和目标文件可能相同, atomic_write 保证读完之前不会覆盖源文件
+    with open(src_path, "rb") as src, atomic_write(dst_path, "wb") as dst:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(encrypt(chunk))
+
+
+def save_json(path, obj):
+    # 输出紧凑格式, 只供程序读取
+    durable = not path.endswith(TEMP_SUFFIX)
+    if orjson is not None:
+        # orjson 直接输出 utf-8 字节, 一次性写入
+        with atomic_write(path, "wb", durable=durable) as f:
+            f.write(orjson.dumps(obj))
+    else:
+        # 标准库分块编码后流式写入, 不在内存中拼出完整字符串
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        with atomic_write(path, "w", durable=durable, encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(encoder.iterencode(obj))
+
+
 class File(QObject):
     def __init__(self):
         super().__init__()
+        # path -> (内容摘要, 写入后的 mtime, 大小), 用于跳过内容未变化的重复写盘
+        self._written = {}
         
     @Slot(str, str, str, str)
     def saveFile(self, path, ctx, mode="w", encry="base64"):
         if "file:///" in path:
             path = path.replace("file:///", "")
 
-        with open(path, mode) as f:
-            if encry == "base64" :
-                ctx = encrypt(ctx)
-            elif encry == "utf-8":
-                ctx = ctx.encode('utf8')
-            else:
-                print("unsupport!")
-                
+        if encry == "base64" :
+            ctx = encrypt(ctx)
+        elif encry == "utf-8":
+            ctx = ctx.encode('utf8')
+        else:
+            print("unsupport!")
+
+        if "a" in mode:
+            # 追加写入不能走临时文件替换, 也不能按内容跳过, 直接追加到原文件
+            with open(path, mode) as f:
+                f.write(ctx)
+            self._written.pop(path, None)
+            return
+
+        data = ctx.encode('utf8') if isinstance(ctx, str) else ctx
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if self._is_unchanged(path, digest):
+            return
+
+        with atomic_write(path, mode, durable=not path.endswith(TEMP_SUFFIX)) as f:
             f.write(ctx)
+        st = os.stat(path)
+        self._written[path] = (digest, st.st_mtime_ns, st.st_size)
+
+    def _is_unchanged(self, path, digest):
+        last = self._written.get(path)
+        if last is None or last[0] != digest:
+            return False
+        # 文件被外部改写或删除时仍需重新写入
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) == last[1:]
             
     @Slot(str, str, str, result=str)
     def readFile(self, path, mode="r", decry="base64"):
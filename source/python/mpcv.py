@@ -2,6 +2,23 @@ import onnxruntime as rt
 import cv2
 import numpy as np
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+
+def imread(path):
+    # jpeg 优先使用 libjpeg-turbo 解码, 其余格式、未安装或解码失败时回退到 cv2
+    # 两条路径都不应用 EXIF 方向, 与界面上 Image 的显示 (autoTransform 关闭) 保持同一坐标系
+    if _turbo_jpeg is not None and path.lower().endswith((".jpg", ".jpeg")):
+        try:
+            with open(path, "rb") as f:
+                return _turbo_jpeg.decode(f.read(), pixel_format=TJPF_BGR)
+        except Exception:
+            pass
+    return cv2.imread(path, cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION)
+
 def preproc_stdmean(ori_img, means, stds):
     img = ori_img.astype(np.float32, copy=False)
     img -= np.array(means)
@@ -13,19 +30,23 @@ def preproc_stdmean(ori_img, means, stds):
 def obb2poly_le90(rboxes):
     N = rboxes.shape[0]
     if N == 0:
-        return rboxes.new_zeros((rboxes.size(0), 8))
+        return np.zeros((0, 8), dtype=rboxes.dtype)
     center, width, height, angle = np.split(rboxes, (2, 3, 4), axis=-1)
-    tl_x, tl_y, br_x, br_y = \
-        -width * 0.5, -height * 0.5, \
-        width * 0.5, height * 0.5
-    rects = np.stack([tl_x, br_x, br_x, tl_x, tl_y, tl_y, br_y, br_y],
-                        axis=0).reshape(2, 4, N).transpose(2, 0, 1)
-    sin, cos = np.sin(angle), np.cos(angle)
-    M = np.stack([cos, -sin, sin, cos], axis=0).reshape(2, 2,
-                                                          N).transpose(2, 0, 1)
-    polys = np.matmul(M,rects).transpose(2, 1, 0).reshape(-1, N).transpose(1, 0)
-    polys[:, ::2] += center[:,:1]
-    polys[:, 1::2] += center[:,1:]
+    # 四个角点固定为 tl, tr, br, bl, 直接写入 (N, 8) 结果, 不经过 stack/matmul
+    hw_cos = width * 0.5 * np.cos(angle)
+    hw_sin = width * 0.5 * np.sin(angle)
+    hh_cos = height * 0.5 * np.cos(angle)
+    hh_sin = height * 0.5 * np.sin(angle)
+    cx, cy = center[:, :1], center[:, 1:]
+    polys = np.empty((N, 8), dtype=np.result_type(rboxes, np.float32))
+    polys[:, 0:1] = cx - hw_cos + hh_sin
+    polys[:, 1:2] = cy - hw_sin - hh_cos
+    polys[:, 2:3] = cx + hw_cos + hh_sin
+    polys[:, 3:4] = cy + hw_sin - hh_cos
+    polys[:, 4:5] = cx + hw_cos - hh_sin
+    polys[:, 5:6] = cy + hw_sin + hh_cos
+    polys[:, 6:7] = cx - hw_cos - hh_sin
+    polys[:, 7:8] = cy - hw_sin + hh_cos
     return polys
 
 def filter_scores_and_topk(results, score_thr, topk):
@@ -36,14 +57,10 @@ def filter_scores_and_topk(results, score_thr, topk):
     valid_idxs = np.nonzero(valid_mask)
     valid_idxs = np.stack(valid_idxs, axis=1)
     num_topk = min(topk, valid_idxs.shape[0])
-    # torch.sort is actually faster than .topk (at least on GPUs)
-    rscores = np.sort(scores)
-    rscores = rscores[::-1]
-    idxs = np.argsort(scores) 
-    idxs = idxs[::-1]
-    
-    rscores = rscores[:num_topk]
-    topk_idxs = valid_idxs[idxs[:num_topk]]
+    # 只排序一次, 分数和索引都通过同一个 order 取出
+    order = np.argsort(scores)[::-1][:num_topk]
+    rscores = scores[order]
+    topk_idxs = valid_idxs[order]
     keep_idxs, labels = topk_idxs[:, 0], topk_idxs[:, 1]
     dets = dets[keep_idxs]
     return dets, rscores, labels, keep_idxs
@@ -53,6 +70,12 @@ def nms_rotate(boxes, scores, iou_threshold, max_output_size):
     num = boxes.shape[0] #获取检测框的个数
 
     suppressed = np.zeros((num), dtype=np.int64)
+    #根据box信息预先组合成opencv中的旋转bbox并计算面积, 避免在内层循环中逐元素索引numpy数组
+    rects = [((x, y), (w, h), a) for x, y, w, h, a in boxes[:, :5].tolist()]
+    areas = (boxes[:, 2] * boxes[:, 3]).tolist()
+    #外接圆不相交的两个旋转框必然没有交集, 先用向量化的距离判断筛掉, 只对候选框求精确交集
+    centers = boxes[:, :2]
+    radii = 0.5 * np.sqrt(boxes[:, 2] ** 2 + boxes[:, 3] ** 2)
     for i in range(num):
         # 若当前保留框集合中的个数大于max_output_size时，直接返回
         if len(keep) >= max_output_size:
@@ -62,16 +85,20 @@ def nms_rotate(boxes, scores, iou_threshold, max_output_size):
         if suppressed[i] == 1:
             continue
         keep.append(i) #保留当前框的索引
-        #根据box信息组合成opencv中的旋转bbox
-        r1 = ((boxes[i, 0], boxes[i, 1]), (boxes[i, 2], boxes[i, 3]), boxes[i, 4])
-        #计算当前检测框的面积
-        area_r1 = boxes[i, 2] * boxes[i, 3]
+        r1 = rects[i]
+        area_r1 = areas[i]
         #对剩余的而进行遍历
-        for j in range(i + 1, num):
-            if suppressed[i] == 1:
+        if iou_threshold > 0:
+            dist2 = ((centers[i + 1:] - centers[i]) ** 2).sum(axis=1)
+            candidates = (np.nonzero(dist2 <= (radii[i] + radii[i + 1:]) ** 2)[0] + i + 1).tolist()
+        else:
+            candidates = range(i + 1, num)
+        for j in candidates:
+            # 已被抑制的框无需再求交集
+            if suppressed[j] == 1:
                 continue
-            r2 = ((boxes[j, 0], boxes[j, 1]), (boxes[j, 2], boxes[j, 3]), boxes[j, 4])
-            area_r2 = boxes[j, 2] * boxes[j, 3]
+            r2 = rects[j]
+            area_r2 = areas[j]
             inter = 0.0
             #求两个旋转矩形的交集，并返回相交的点集合
             int_pts = cv2.rotatedRectangleIntersection(r1, r2)[1]
@@ -1,11 +1,9 @@
-import cv2
 import numpy as np
 from .mpcv import *
-from .base import registry
+from .base import registry, get_providers
 import os 
-import json
 from io import BytesIO
-from .file_io import File
+from .file_io import File, save_json
 
 @registry.register('rtmdet')
 class Rtmdet():
@@ -14,7 +12,9 @@ class Rtmdet():
         file = File()
         model_bytes = file.readFile(ctx["path"], "rb", "base64")
         # model_stream = BytesIO(model_bytes)
-        self.sess = rt.InferenceSession(model_bytes, providers=['CPUExecutionProvider'])
+        self.sess = rt.InferenceSession(model_bytes, providers=get_providers())
+        # fp16 模型的输入需要同样转为 fp16, 后处理仍使用 fp32
+        self.input_dtype = np.float16 if self.sess.get_inputs()[0].type == "tensor(float16)" else np.float32
         self.means = ctx["means"]
         self.stds = ctx["stds"]
         self.pre_nms_num = ctx["pre_nms_num"]
@@ -25,9 +25,12 @@ class Rtmdet():
     def __call__(self, path):
         if "file:///" in path:
             path = path.replace("file:///", "")
-        ori_img = cv2.imread(path)
+        ori_img = imread(path)
         input_data = preproc_stdmean(ori_img, self.means, self.stds)
+        if self.input_dtype is not np.float32:
+            input_data = input_data.astype(self.input_dtype)
         result = self.sess.run(None, {"input": input_data})
+        result = [r.astype(np.float32) if r.dtype == np.float16 else r for r in result]
         filter_result = filter_scores_and_topk(result, self.conf, self.pre_nms_num)
         
         dets, scores, labels, keep_idxs  = filter_result
@@ -35,29 +38,23 @@ class Rtmdet():
         keep = nms_rotate(adets, scores, self.nms_threshold, self.pre_nms_num)
         dets = dets[keep]
         labels = labels[keep]
-        polys = obb2poly_le90(dets)  
         dets_hbb = obb2hbb(dets)
         ext = os.path.splitext(path)
         self.serialize(dets_hbb, labels, ext[0] + ".maple") 
         
     def serialize(self, dets, labels, output_path):
-        res = {}
-        res["version"] = "1.0.1"
-        shapes_res = []
-        for i, det in enumerate(dets):
-            det_res = {}
-            det_res["type"] = "rect"
-            det_res["x"] = det[0]
-            det_res["y"] = det[1]
-            det_res["width"] = det[2]
-            det_res["height"] = det[3]
-            det_res["rotation"] = det[4]
-            det_res["objType"] = self.obj_type[labels[i]]
-            shapes_res.append(det_res)
-        res["shapes"] = shapes_res
-        json_dict = json.dumps(res)
-        with open(output_path, "w", encoding='utf-8') as f:
-            f.write(json_dict)
+        obj_type = self.obj_type
+        shapes_res = [{
+            "type": "rect",
+            "x": det[0],
+            "y": det[1],
+            "width": det[2],
+            "height": det[3],
+            "rotation": det[4],
+            "objType": obj_type[label],
+        } for det, label in zip(dets.tolist(), labels.tolist())]
+        res = {"version": "1.0.1", "shapes": shapes_res}
+        save_json(output_path, res)
 
         
         
\ No newline at end of file
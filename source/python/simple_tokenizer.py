@@ -53,8 +53,11 @@ def basic_clean(text):
     return text.strip()
 
 
+_whitespace_pat = re.compile(r'\s+')
+
+
 def whitespace_clean(text):
-    text = re.sub(r'\s+', ' ', text)
+    text = _whitespace_pat.sub(' ', text)
     text = text.strip()
     return text
 
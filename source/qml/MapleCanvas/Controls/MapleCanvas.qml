@@ -33,6 +33,14 @@ Image {
     signal openSignal(string path)
     signal saveSignal(string path)
 
+    // 拖拽时位置变化频率很高, 合并到一帧内只刷新一次详情面板
+    Timer {
+        id: instModelTimer
+        interval: 16
+        repeat: false
+        onTriggered: updateCurInstModelInfo()
+    }
+
     MouseArea {
         acceptedButtons: Qt.LeftButton | Qt.RightButton
         anchors.fill: parent
@@ -82,7 +90,7 @@ Image {
                         curUnCompletedInst.destroy()
                     }    
                 } else {
-                    curUnCompletedInst.positionChanged.connect(updateCurInstModelInfo)
+                    curUnCompletedInst.positionChanged.connect(requestCurInstModelInfo)
 
                     // init extra params
                     if (settings !== null && curUnCompletedInst.shapeType in settings) {
@@ -243,23 +251,7 @@ Image {
         if (historyRecoder.length > 1 && undoCount < historyRecoder.length) {
             
             undoCount ++
-            curActivatedInsts = []
-            for (var i in insts) {
-                var inst = insts[i]
-                inst.destroy()
-            }
-            var recoder = historyRecoder[historyRecoder.length - 1 - undoCount]
-            var tmp_insts = []
-            for (var i in recoder) {
-                var rec = recoder[i]
-                var obj = createInst(toolTypeLUT[rec.type])
-                obj.reConstruct(rec)
-                obj.positionChanged.connect(updateCurInstModelInfo)
-                tmp_insts.push(obj)
-            }
-            insts = tmp_insts
-            
-            
+            restoreHistory(historyRecoder[historyRecoder.length - 1 - undoCount])
         }
         undoEnable = false
         
@@ -269,25 +261,33 @@ Image {
         redoEnable = true
         if (historyRecoder.length > 1 && undoCount > 0) {
             undoCount --
-            curActivatedInsts = []
-            for (var i in insts) {
-                var inst = insts[i]
-                inst.destroy()
-            }
-            var recoder = historyRecoder[historyRecoder.length - 1 - undoCount]
-            var tmp_insts = []
-            for (var i in recoder) {
-                var rec = recoder[i]
-                var obj = createInst(toolTypeLUT[rec.type])
-                obj.reConstruct(rec)
-                obj.positionChanged.connect(updateCurInstModelInfo)
-                tmp_insts.push(obj)
-            }
-            insts = tmp_insts
+            restoreHistory(historyRecoder[historyRecoder.length - 1 - undoCount])
         }
         redoEnable = false
     }
 
+    // 用一条历史记录替换当前所有形状
+    function restoreHistory(recoder) {
+        curActivatedInsts = []
+        for (var i in insts) {
+            insts[i].destroy()
+        }
+        insts = reConstructInsts(recoder)
+    }
+
+    // 由序列化数据重建形状, 并接入详情面板刷新
+    function reConstructInsts(records) {
+        var tmp = []
+        for (var i in records) {
+            var rec = records[i]
+            var obj = createInst(toolTypeLUT[rec.type])
+            obj.reConstruct(rec)
+            obj.positionChanged.connect(requestCurInstModelInfo)
+            tmp.push(obj)
+        }
+        return tmp
+    }
+
     function resetAnnotation() {
         if (settings !== null && "annotation" in settings) {
   
@@ -318,18 +318,36 @@ Image {
         extraParamsOut = annotations
     }
 
+    function requestCurInstModelInfo() {
+        // 没有选中对象且详情面板已为空时 (例如拖动一个未选中的形状, 选中要到点击/松开时才发生), 无需刷新
+        if ((curActivatedInsts === null || curActivatedInsts.length === 0) && curActivatedInstModel.count === 0) {
+            return
+        }
+        if (!instModelTimer.running) {
+            instModelTimer.start()
+        }
+    }
+
     function updateCurInstModelInfo() {
-        var tmp = Qt.createQmlObject("import QtQuick; ListModel {}", parent);
+        var obj = null
         if (curActivatedInsts !== null && curActivatedInsts.length > 0) {
-            
-            var curInst = curActivatedInsts[0]
-            var obj = curInst.detailSerialize()
-            for (var i in obj) {
-                var value = obj[i]
-                tmp.append(value)
-            } 
-        } 
-        curActivatedInstModel = tmp
+            obj = curActivatedInsts[0].detailSerialize()
+        }
+        if (obj === null) {
+            obj = []
+        }
+        // 复用同一个 ListModel, 行数不变时逐行 set, 避免每次刷新重新创建模型和委托
+        var model = curActivatedInstModel
+        if (model.count !== obj.length) {
+            model.clear()
+            for (var i = 0; i < obj.length; i++) {
+                model.append(obj[i])
+            }
+        } else {
+            for (var j = 0; j < obj.length; j++) {
+                model.set(j, obj[j])
+            }
+        }
     }
 
     function updateActivatedStates() {   
@@ -424,20 +442,7 @@ Image {
             reConstructAnnotation(ctx.annotation)
         }
 
-        var tmp = []
-        // try {
-            var shapes = ctx["shapes"]
-            for (var i in shapes) {
-                var shape = shapes[i]
-                var obj = createInst(toolTypeLUT[shape.type])
-                obj.reConstruct(shape)
-                obj.positionChanged.connect(updateCurInstModelInfo)
-                tmp.push(obj)
-            }
-        // } catch(err) {
-        //     console.log("label has been revised.")
-        // }
-        insts = tmp
+        insts = reConstructInsts(ctx["shapes"])
         
     }
 
@@ -181,7 +181,7 @@ MapleSelector {
             obj.controller = controller
             obj.reConstruct(shape)
             obj.activatedClicked.connect(bindActivated)
-            obj.positionChanged.connect(controller.updateCurInstModelInfo)
+            obj.positionChanged.connect(controller.requestCurInstModelInfo)
             container.push(obj)
         }
         reConstructExtraParams(ctx)
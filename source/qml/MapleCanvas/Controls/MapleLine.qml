@@ -10,7 +10,7 @@ MapleTool {
     property int thickness: 1
 
     Rectangle {
-        width: Math.sqrt((end.x - start.x) * (end.x - start.x) + (end.y - start.y) * (end.y - start.y))
+        width: Math.hypot(end.x - start.x, end.y - start.y)
         height: thickness
         color: "green"
         x: start.x
@@ -53,33 +53,40 @@ MapleTool {
     }   
 
     function checkBorder() {
-        var tlPt = {"x":999999, "y":999999}
-        var brPt = {"x":-999999,"y":-999999}
-        for (var i in container) {
-            if (i % 2 === 0) {
-                
-                if (tlPt.x > container[i].x) {
-                    tlPt.x = container[i].x              
-                }
-                if( tlPt.y > container[i].y) {
-                    tlPt.y = container[i].y
-                }
-                if (brPt.x < container[i].x) {
-                    brPt.x = container[i].x
-                }
-                if( brPt.y < container[i].y) {
-                    brPt.y = container[i].y
-                }
+        var minX = 999999
+        var minY = 999999
+        var maxX = -999999
+        var maxY = -999999
+        // container 中点和线交替存放, 偶数下标是点, 直接按步长 2 取
+        for (var i = 0; i < container.length; i += 2) {
+            var pt = container[i]
+            var px = pt.x
+            var py = pt.y
+            if (px < minX) {
+                minX = px
+            }
+            if (py < minY) {
+                minY = py
+            }
+            if (px > maxX) {
+                maxX = px
+            }
+            if (py > maxY) {
+                maxY = py
             }
-
         }
-        border.x = tlPt.x
-        border.y = tlPt.y
-        border.width = brPt.x - tlPt.x
-        border.height = brPt.y - tlPt.y
+        border.x = minX
+        border.y = minY
+        border.width = maxX - minX
+        border.height = maxY - minY
         positionChanged(mapleX, mapleY)
     }
 
+    // 拖动顶点时 x/y 会先后变化, 合并到同一轮事件循环里只重算一次外框
+    function requestCheckBorder() {
+        Qt.callLater(checkBorder)
+    }
+
     function bindActivated(state) {
         if (state) {
             for (var i in container) {
@@ -132,7 +139,7 @@ MapleTool {
 
         
         curPoint = controller.mapleTools[MapleTool.ToolType.Point].createObject(root, { "x": x, "y": y }); 
-        curPoint.positionChanged.connect(checkBorder)
+        curPoint.positionChanged.connect(requestCheckBorder)
         curPoint.activatedClicked.connect(bindActivated)
         if (firstTime) {
            firstTime = false
@@ -212,22 +219,26 @@ MapleTool {
         mapleY = ctx.y 
         mapleWidth = ctx.width
         mapleHeight = ctx.height
-        for (var i in ctx.shapes) {
-            var shape = ctx.shapes[i]
-            var obj = controller.mapleTools[MapleTool.ToolType.Point].createObject(root)
-            obj.reConstruct(shape)
-            obj.positionChanged.connect(checkBorder)
+        var shapes = ctx.shapes
+        var pointComp = controller.mapleTools[MapleTool.ToolType.Point]
+        var lineComp = controller.mapleTools[MapleTool.ToolType.Line]
+        var obj = null
+        for (var i = 0; i < shapes.length; i++) {
+            obj = pointComp.createObject(root)
+            obj.reConstruct(shapes[i])
+            obj.positionChanged.connect(requestCheckBorder)
             obj.activatedClicked.connect(bindActivated)
             if (i > 0) {
-                var line = controller.mapleTools[MapleTool.ToolType.Line].createObject(root, { "start": container[container.length - 1], "end": obj}); 
+                var line = lineComp.createObject(root, { "start": container[container.length - 1], "end": obj}); 
                 container.push(line)
             }
             container.push(obj)
-            if (i > ctx.shapes.length - 2) {
-                var endline = controller.mapleTools[MapleTool.ToolType.Line].createObject(root, { "start": obj, "end": container[0]}); 
-                container.push(endline)
-            }
-        }  
+        }
+        // 最后一个点连回第一个点闭合多边形
+        if (obj !== null) {
+            var endline = lineComp.createObject(root, { "start": obj, "end": container[0]}); 
+            container.push(endline)
+        }
         reConstructExtraParams(ctx)
     }
 
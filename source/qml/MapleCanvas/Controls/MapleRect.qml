@@ -12,6 +12,9 @@ MapleTool {
     property int borderMargin: 4
     property int startX
     property int startY
+    // 边拖拽每帧都要用到旋转角的三角函数, 只在 rotation 变化时计算一次
+    readonly property real rotationCos: Math.cos(rotation * Math.PI / 180)
+    readonly property real rotationTan: Math.tan(rotation * Math.PI / 180)
     
     Rectangle {
         anchors.fill: parent
@@ -47,14 +50,7 @@ MapleTool {
         // }
     }
 
-    onXChanged: {
-        positionChanged(x, y)
-    }
-
-    onYChanged: {
-        positionChanged(x, y)
-    }
-
+    // x/y 的变化已由 MapleTool 发出 positionChanged, 这里只补充尺寸和旋转
     onWidthChanged: {
         positionChanged(x, y)
     }
@@ -174,10 +170,9 @@ MapleTool {
         height: borderMargin
         anchors.top : parent.top
         onPosChanged: function(xOffset, yOffset){  
-            var theta = root.rotation / 180 * 3.1415926
-            root.x = root.x - 0.5 * Math.tan(theta) * yOffset
-            root.y = root.y + 0.5 * yOffset + 0.5 * yOffset / Math.cos(theta)
-            root.height = root.height - yOffset / Math.cos(theta)
+            root.x = root.x - 0.5 * root.rotationTan * yOffset
+            root.y = root.y + 0.5 * yOffset + 0.5 * yOffset / root.rotationCos
+            root.height = root.height - yOffset / root.rotationCos
         }
     }
 
@@ -190,10 +185,9 @@ MapleTool {
         width: borderMargin
         anchors.left : parent.left
         onPosChanged: function(xOffset, yOffset){  
-            var theta = root.rotation / 180 * 3.1415926
-            root.y = root.y + 0.5 * Math.tan(theta) * xOffset
-            root.x = root.x + 0.5 * xOffset + 0.5 * xOffset / Math.cos(theta)
-            root.width = root.width - xOffset / Math.cos(theta)
+            root.y = root.y + 0.5 * root.rotationTan * xOffset
+            root.x = root.x + 0.5 * xOffset + 0.5 * xOffset / root.rotationCos
+            root.width = root.width - xOffset / root.rotationCos
         }
     }
 
@@ -207,10 +201,9 @@ MapleTool {
         width: borderMargin
 
         onPosChanged: function(xOffset, yOffset){  
-            var theta = root.rotation / 180 * 3.1415926
-            root.y = root.y + 0.5 * Math.tan(theta) * xOffset
-            root.x = root.x + 0.5 * xOffset - 0.5 * xOffset / Math.cos(theta)
-            root.width = root.width + xOffset / Math.cos(theta)
+            root.y = root.y + 0.5 * root.rotationTan * xOffset
+            root.x = root.x + 0.5 * xOffset - 0.5 * xOffset / root.rotationCos
+            root.width = root.width + xOffset / root.rotationCos
         }
     }
 
@@ -223,10 +216,9 @@ MapleTool {
         width: parent.width
         height: borderMargin
         onPosChanged: function(xOffset, yOffset){  
-            var theta = root.rotation / 180 * 3.1415926
-            root.x = root.x - 0.5 * Math.tan(theta) * yOffset
-            root.y = root.y + 0.5 * yOffset - 0.5 * yOffset / Math.cos(theta)
-            root.height = root.height + yOffset / Math.cos(theta)
+            root.x = root.x - 0.5 * root.rotationTan * yOffset
+            root.y = root.y + 0.5 * yOffset - 0.5 * yOffset / root.rotationCos
+            root.height = root.height + yOffset / root.rotationCos
         }
     }
 
@@ -14,35 +14,30 @@ MapleTool {
 
     function selectMultInst() {
         var insts = []
-        for (var i in controller.insts) {
-            var inst = controller.insts[i]
-            if (inst.shapeType === "polygen") {  
-                var cx = inst.mapleX + inst.mapleWidth * 0.5
-                var cy = inst.mapleY + inst.mapleHeight * 0.5
-                if (cx > root.x && cx < root.x + root.width && cy > root.y && cy < root.y + root.height) {
-                    insts.push(inst)
-                }
-            } else if (inst.shapeType === "point") {
-                
-                var cx = inst.x
-                var cy = inst.y
-                if (cx > root.x && cx < root.x + root.width && cy > root.y && cy < root.y + root.height) {
-                    insts.push(inst)
-                }
-            } else if (inst.shapeType === "rect") {
-                var cx = inst.x + inst.width * 0.5
-                var cy = inst.y + inst.height * 0.5
-                if (cx > root.x && cx < root.x + root.width && cy > root.y && cy < root.y + root.height) {
-                    insts.push(inst)
-                }
-            } else if (inst.shapeType === "group") {  
-                var cx = inst.mapleX + inst.mapleWidth * 0.5
-                var cy = inst.mapleY + inst.mapleHeight * 0.5
-                if (cx > root.x && cx < root.x + root.width && cy > root.y && cy < root.y + root.height) {
-                    insts.push(inst)
-                }
+        // 框选范围只取一次, 循环内只做数值比较
+        var left = root.x
+        var top = root.y
+        var right = root.x + root.width
+        var bottom = root.y + root.height
+        var all = controller.insts
+        for (var i = 0; i < all.length; i++) {
+            var inst = all[i]
+            var type = inst.shapeType
+            var cx, cy
+            if (type === "polygen" || type === "group") {
+                cx = inst.mapleX + inst.mapleWidth * 0.5
+                cy = inst.mapleY + inst.mapleHeight * 0.5
+            } else if (type === "point") {
+                cx = inst.x
+                cy = inst.y
+            } else if (type === "rect") {
+                cx = inst.x + inst.width * 0.5
+                cy = inst.y + inst.height * 0.5
             } else {
-
+                continue
+            }
+            if (cx > left && cx < right && cy > top && cy < bottom) {
+                insts.push(inst)
             }
         }
         return insts
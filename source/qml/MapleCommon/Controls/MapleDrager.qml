@@ -26,27 +26,11 @@ Item {
             id: cursor
             source: ""
             mipmap: true
-            visible: mouseArea.containsMouse | mouseArea.pressed
+            visible: status !== Image.Null && (mouseArea.containsMouse | mouseArea.pressed)
         }
 
-        onContainsMouseChanged: {
-
-            if (containsMouse) {
-                if (mouseCursorShape !== null) {
-                    cursorShape = mouseCursorShape;
-                } else {
-                    cursorShape = Qt.BlankCursor
-                }
-                
-            } else {
-                if (mouseCursorShape !== null) {
-                    cursorShape = mouseCursorShape
-                } else {
-                    cursorShape = Qt.BlankCursor
-                }
-
-            }
-        }
+        // 光标形状只依赖 mouseCursorShape, 用绑定代替每次悬停进出时的重复赋值
+        cursorShape: root.mouseCursorShape !== null ? root.mouseCursorShape : Qt.BlankCursor
 
 
         onPressedChanged: {
@@ -57,11 +41,15 @@ Item {
         }
         onPositionChanged: {
 
-            if (pressed) {
+            // 偏移为 0 时 (例如只有按键状态变化) 不发信号, 省去下游一整轮几何更新
+            if (pressed && (mouseX !== lastX || mouseY !== lastY)) {
                 posChanged(mouseX - lastX, mouseY - lastY)
             }
-            cursor.x = mouseX - 0.5 * cursor.width
-            cursor.y = mouseY - 0.5 * cursor.height
+            // 未设置光标图片时不必跟随鼠标移动, 避免拖拽时每帧改子项几何
+            if (cursor.status !== Image.Null) {
+                cursor.x = mouseX - 0.5 * cursor.width
+                cursor.y = mouseY - 0.5 * cursor.height
+            }
 
         }
 